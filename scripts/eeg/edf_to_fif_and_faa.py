@@ -10,16 +10,29 @@ listed here so students know exactly what happens to the data:
 - EEG average reference (``kind='average'``).
 - FIR bandpass filter on EEG: 1–40 Hz (``firwin`` design).
 - Notch filter on EEG: 50 and 100 Hz.
+- Set ``APPLY_FIR_FILTER = False`` to skip both filters when only the FAA CSV
+  matters; the alpha-band PSD ignores everything outside 8–13 Hz anyway, but
+  the saved FIF is then unfiltered.
 - Re-type channels lacking finite positions or overlapping positions to
   ``misc`` before interpolation.
 - PREP-inspired bad-channel detection using robust z-scores:
-  - Amplitude z-threshold: 5.0 (log10 peak-to-peak after downsampling).
+  - Amplitude z-threshold: 5.0 (log10 peak-to-peak after anti-aliased
+    downsampling).
   - Correlation z-threshold: 5.0 (1 - |r| against channel median).
   - High-frequency ratio z-threshold: 5.0 (50–125 Hz vs 1–40 Hz power).
-  - RANSAC-style predictability z-threshold: 5.0.
+  - RANSAC-style predictability z-threshold: 5.0. With the default average
+    reference every channel is exactly predictable from the others, so this
+    check cannot flag anything; the log says so when it happens.
 - Bad-channel interpolation with ``reset_bads=False``.
 - Frontal alpha asymmetry (FAA) as ``log10(power_F4) - log10(power_F3)`` in the
-  8–13 Hz band, saved to CSV.
+  8–13 Hz band, saved to CSV. Uses the whole recording by default; set
+  ``FAA_WINDOW_S`` (seconds, > 0) to use only the start of each recording.
+- FFTs use FFTW automatically when the optional ``pyfftw`` package is
+  installed; otherwise SciPy's built-in FFT is used. Results are the same.
+- EDFs are processed in parallel worker processes, one per CPU core (capped
+  at the number of EDFs), each limited to a single math thread; all logging
+  still goes to the one log file. Set ``N_JOBS = 1`` to process them one at
+  a time (e.g. on a low-memory machine).
 
 Usage
 -----
@@ -34,28 +47,61 @@ Inputs (same folder as the script)
 
 Outputs (same folder as the script)
 -----------------------------------
-- One cleaned FIF per EDF (``<stem>_clean_eeg.fif``).
+- One cleaned FIF per EDF (``<stem>_clean_eeg.fif``), written in the
+  background while FAA is computed; set ``SAVE_FIF = False`` to skip it when
+  only FAA is needed.
 - One FAA CSV per EDF with participant, condition, ``log10_F3``, ``log10_F4``,
   and ``faa_log10`` (F4 - F3).
+- ``all_faa.csv``: the FAA rows of every EDF in this run, in one table.
 """
 from __future__ import annotations
 
 import csv
+import functools
 import logging
+import logging.handlers
+import math
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, Tuple
 
 import mne
 import numpy as np
-from mne.time_frequency import psd_array_welch
+import scipy.fft
+from scipy.signal import oaconvolve, resample_poly, welch
+
+try:  # Optional: route scipy.fft (Welch, MNE's FIR filtering) through FFTW.
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+except ImportError:  # fall back to scipy's bundled pocketfft
+    pyfftw = None
+else:
+    pyfftw.interfaces.cache.enable()
+    scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
 
 ALPHA_BAND: Tuple[float, float] = (8.0, 13.0)
+FAA_CHANNELS: Tuple[str, str] = ("F3", "F4")
+FAA_N_PER_SEG = 2048
+FAA_WINDOW_S: float | None = None
 TRAINING_CHANNELS = ["[T1] EEG Trainin", "[T2] EEG Trainin"]
+APPLY_FIR_FILTER = True
 L_FREQ = 1.0
 H_FREQ = 40.0
 NOTCH_FREQS = [50.0, 100.0]
 REF_KIND = "average"
+SAVE_FIF = True
+FAA_SUMMARY_CSV = "all_faa.csv"
+N_JOBS: int | None = None
+FFT_WORKERS = -1
+_SINGLE_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
 BAD_Z_THRESH_AMP = 5.0
 BAD_Z_THRESH_CORR = 5.0
 BAD_Z_THRESH_HF = 5.0
@@ -64,6 +110,9 @@ BAD_LF_BAND: Tuple[float, float] = (1.0, 40.0)
 BAD_HF_BAND: Tuple[float, float] = (50.0, 125.0)
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+# Built once per process; set_montage works on its own copy of the montage.
+_STD_1020 = mne.channels.make_standard_montage("standard_1020")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -100,6 +149,83 @@ def _robust_zscore(values: np.ndarray) -> np.ndarray:
     return (values - med) / (1.4826 * mad)
 
 
+def _uniform_trapezoid(values: np.ndarray, dx: float) -> np.ndarray:
+    """Trapezoid integral of each row over evenly spaced samples ``dx`` apart.
+
+    Same result as ``np.trapz(values, dx=dx, axis=1)`` (gone from NumPy 2.4+):
+    the plain sum with half of each end sample taken back off. Rows with
+    fewer than two samples integrate to 0.
+    """
+
+    if values.shape[1] == 0:
+        return np.zeros(values.shape[0])
+    return dx * (values.sum(axis=1) - 0.5 * (values[:, 0] + values[:, -1]))
+
+
+def _rowwise_abs_uncorrelation(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return ``1 - |r|`` between matching rows of ``a`` and ``b`` (1.0 if undefined)."""
+
+    a = a - a.mean(axis=1, keepdims=True)
+    b = b - b.mean(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = np.einsum("ij,ij->i", a, b) / np.sqrt(
+            np.einsum("ij,ij->i", a, a) * np.einsum("ij,ij->i", b, b)
+        )
+    return np.where(np.isnan(r), 1.0, 1.0 - np.abs(r))
+
+
+def _leave_one_out_median(data: np.ndarray) -> np.ndarray:
+    """Median across all *other* rows, for every row, from a single sort.
+
+    Dropping a row from the per-sample sorted stack shifts the ranks above it
+    down by one, so each leave-one-out median is read off the full sort by
+    comparing the row's own rank with the median rank(s).
+    """
+
+    n_chans = data.shape[0]
+    order = np.argsort(data, axis=0, kind="stable")
+    sorted_data = np.take_along_axis(data, order, axis=0)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(n_chans)[:, None], axis=0)
+
+    def nth_of_others(j: int) -> np.ndarray:
+        return np.where(ranks > j, sorted_data[j], sorted_data[j + 1])
+
+    if n_chans % 2 == 0:
+        return nth_of_others((n_chans - 2) // 2)
+    return 0.5 * (nth_of_others((n_chans - 3) // 2) + nth_of_others((n_chans - 1) // 2))
+
+
+# A row lies in the span of the other rows when it has weight on the Gram
+# matrix's null space. Eigenvectors are unit-norm, so that squared weight is in
+# [0, 1]; anything above round-off level marks an exact linear dependency.
+_IN_SPAN_TOL = 1e-6
+
+
+def _leave_one_out_prediction(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Least-squares prediction of every row from all other rows at once.
+
+    With ``P`` the (pseudo-)inverse of the Gram matrix ``data @ data.T``, the
+    residual of regressing row ``i`` on the others is ``(P @ data)[i] / P[i, i]``.
+    Rows involved in an exact linear dependency (e.g. after average
+    referencing) lie in the span of the others and are predicted exactly;
+    they are flagged in the returned boolean mask.
+    """
+
+    # Highly correlated EEG rows make the Gram matrix ill-conditioned; its
+    # small eigenvalues do not survive float32, so solve in float64.
+    data = np.asarray(data, dtype=np.float64)
+    n_chans, n_times = data.shape
+    evals, evecs = np.linalg.eigh(data @ data.T)
+    keep = evals > evals[-1] * max(n_chans, n_times) * np.finfo(float).eps
+    pinv = (evecs[:, keep] / evals[keep]) @ evecs[:, keep].T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        residual = (pinv @ data) / np.diag(pinv)[:, None]
+    in_span = np.sum(evecs[:, ~keep] ** 2, axis=1) > _IN_SPAN_TOL
+    residual[in_span] = 0.0
+    return data - residual, in_span
+
+
 def configure_logging(out_dir: Path) -> logging.Logger:
     out_dir.mkdir(parents=True, exist_ok=True)
     log_file = out_dir / "edf_to_fif_and_faa.log"
@@ -119,13 +245,26 @@ def configure_logging(out_dir: Path) -> logging.Logger:
     return logger
 
 
-def load_rename_map(tsv_path: Path, logger: logging.Logger) -> dict[str, str]:
-    """Load mandatory channel rename mapping from a two-column TSV."""
+def _canon(ch_name: str) -> str:
+    """Canonical channel name: EDF exporters write bipolar labels with ``+`` or ``~``."""
+
+    return ch_name.replace("+", "~")
+
+
+def load_rename_map(
+    tsv_path: Path, logger: logging.Logger
+) -> dict[str, Tuple[str, str]]:
+    """Load mandatory channel rename mapping from a two-column TSV.
+
+    Keys are canonical names (see ``_canon``) so either spelling matches;
+    values are ``(original, new)`` with the TSV's own spelling of the first
+    row for that channel, for messages the user can search for.
+    """
 
     if not tsv_path.exists():
         raise FileNotFoundError(f"Rename TSV not found: {tsv_path}")
 
-    rename_map: dict[str, str] = {}
+    rename_map: dict[str, Tuple[str, str]] = {}
     with tsv_path.open("r", newline="") as handle:
         reader = csv.reader(handle, delimiter="\t")
         for row in reader:
@@ -134,15 +273,7 @@ def load_rename_map(tsv_path: Path, logger: logging.Logger) -> dict[str, str]:
             original, new = (cell.strip() for cell in row[:2])
             if not original or not new:
                 continue
-
-            candidates = {original}
-            if "+" in original:
-                candidates.add(original.replace("+", "~"))
-            if "~" in original:
-                candidates.add(original.replace("~", "+"))
-
-            for key in candidates:
-                rename_map.setdefault(key, new)
+            rename_map.setdefault(_canon(original), (original, new))
     if not rename_map:
         raise ValueError(f"Rename TSV is empty: {tsv_path}")
 
@@ -174,6 +305,17 @@ def find_edf_files(directory: Path) -> Iterable[Path]:
     return sorted(directory.glob("*.edf"))
 
 
+def _warm_file_cache(path: Path, chunk_size: int = 1 << 20) -> None:
+    """Pull ``path`` into the OS page cache so a later read is served from RAM."""
+
+    with path.open("rb") as handle:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            return
+        while handle.read(chunk_size):
+            pass
+
+
 def set_channel_types_ignore_missing(
     raw: mne.io.BaseRaw, mapping: dict[str, str], logger: logging.Logger, context: str
 ) -> None:
@@ -201,7 +343,10 @@ def set_channel_types_ignore_missing(
 
 
 def apply_channel_renames(
-    raw: mne.io.BaseRaw, rename_map: dict[str, str], rename_label: str, logger: logging.Logger
+    raw: mne.io.BaseRaw,
+    rename_map: dict[str, Tuple[str, str]],
+    rename_label: str,
+    logger: logging.Logger,
 ) -> None:
     """Rename channels using the provided mapping and set EEG types."""
 
@@ -209,7 +354,9 @@ def apply_channel_renames(
         logger.info("No rename map provided; keeping channel names as-is")
         return
 
-    present_map = {orig: new for orig, new in rename_map.items() if orig in raw.ch_names}
+    present_map = {
+        ch: rename_map[_canon(ch)][1] for ch in raw.ch_names if _canon(ch) in rename_map
+    }
     if present_map:
         raw.rename_channels(present_map)
         present_eeg = {new: "eeg" for new in present_map.values()}
@@ -221,14 +368,8 @@ def apply_channel_renames(
         )
         logger.info("Renamed %d channels using %s", len(present_map), rename_label)
 
-    missing_keys = set(rename_map) - set(present_map)
-    for orig in present_map:
-        if "+" in orig:
-            missing_keys.discard(orig.replace("+", "~"))
-        if "~" in orig:
-            missing_keys.discard(orig.replace("~", "+"))
-
-    missing = sorted(missing_keys)
+    found = {_canon(ch) for ch in present_map}
+    missing = sorted(original for key, (original, _) in rename_map.items() if key not in found)
     if missing:
         logger.info("Channels from rename template not found: %s", ", ".join(missing))
 
@@ -266,27 +407,26 @@ def _deduplicate_overlapping_eeg_positions(
     if len(eeg_picks) == 0:
         return
 
-    pos_seen: dict[tuple[float, float, float], str] = {}
+    locs = np.array([raw.info["chs"][idx]["loc"][:3] for idx in eeg_picks], dtype=float)
+    finite = np.all(np.isfinite(locs), axis=1)
+    picks = eeg_picks[finite]
+    # ``+ 0.0`` folds -0.0 into 0.0 so np.unique's bytewise row comparison
+    # groups them like the float comparison does.
+    keys = np.round(locs[finite], decimal) + 0.0
+    _, first_idx, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    first_of = first_idx[inverse.reshape(-1)]
     to_misc: dict[str, str] = {}
 
-    for idx in eeg_picks:
-        ch = raw.info["chs"][idx]
-        loc = np.asarray(ch["loc"][:3], float)
-        if loc.shape[0] != 3:
-            continue
-        key = tuple(np.round(loc, decimal))
-        if key in pos_seen:
-            ch_name = raw.ch_names[idx]
-            first_name = pos_seen[key]
-            logger.warning(
-                "Channel %s shares position with %s; retyping %s as 'misc' to avoid overlapping topomap issues",
-                ch_name,
-                first_name,
-                ch_name,
-            )
-            to_misc[ch_name] = "misc"
-        else:
-            pos_seen[key] = raw.ch_names[idx]
+    for i in np.flatnonzero(first_of != np.arange(len(keys))):
+        ch_name = raw.ch_names[picks[i]]
+        first_name = raw.ch_names[picks[first_of[i]]]
+        logger.warning(
+            "Channel %s shares position with %s; retyping %s as 'misc' to avoid overlapping topomap issues",
+            ch_name,
+            first_name,
+            ch_name,
+        )
+        to_misc[ch_name] = "misc"
 
     if to_misc:
         set_channel_types_ignore_missing(
@@ -313,6 +453,7 @@ def detect_bad_channels_prep(
     lf_band: Tuple[float, float] = (1.0, 40.0),
     hf_band: Tuple[float, float] = (50.0, 125.0),
     logger: logging.Logger | None = None,
+    block_chans: int = 8,
 ) -> list[str]:
     """PREP-inspired bad channel detection using robust z-score criteria."""
 
@@ -320,57 +461,74 @@ def detect_bad_channels_prep(
     if len(eeg_picks) == 0:
         return []
 
-    data = raw.get_data(picks=eeg_picks)
+    # Scratch copy for the detector only (raw._data stays float64 for the
+    # FIF); every criterion below is a dimensionless robust z-score, so
+    # float32 loses nothing and halves the memory traffic of each pass. It is
+    # filled a few rows at a time so no full float64 copy is ever made.
     sfreq = raw.info["sfreq"]
-    n_chans, n_times = data.shape
-
+    n_chans, n_times = len(eeg_picks), raw.n_times
+    data = np.empty((n_chans, n_times), dtype=np.float32)
+    for start in range(0, n_chans, block_chans):
+        stop = start + block_chans
+        data[start:stop] = raw.get_data(picks=eeg_picks[start:stop])
+
+    # Decimate to ~20k samples per channel with a polyphase anti-aliasing
+    # filter; plain striding would fold high-frequency content into the band
+    # used by the amplitude/correlation/predictability criteria. Edges are
+    # padded along a line fit rather than with zeros, which would ramp each
+    # channel from 0 to its DC offset and make ptp measure the offset.
     ds = max(1, int(n_times // 20000))
-    data_ds = data[:, ::ds]
+    data_ds = resample_poly(data, 1, ds, axis=-1, padtype="line") if ds > 1 else data
 
     amp = np.ptp(data_ds, axis=1)
     z_amp = _robust_zscore(np.log10(amp + np.finfo(float).eps))
     bad_amp = set(np.where(np.abs(z_amp) > z_thresh_amp)[0])
 
     bad_corr: set[int] = set()
-    uncorr_vals = []
-    for idx in range(n_chans):
-        others = np.delete(data_ds, idx, axis=0)
-        if others.size == 0:
-            uncorr_vals.append(0.0)
-            continue
-        y = np.median(others, axis=0)
-        r = np.corrcoef(data_ds[idx], y)[0, 1]
-        uncorr_vals.append(1.0 if np.isnan(r) else 1.0 - np.abs(r))
-    z_corr = _robust_zscore(np.asarray(uncorr_vals))
+    if n_chans > 1:
+        uncorr_vals = _rowwise_abs_uncorrelation(data_ds, _leave_one_out_median(data_ds))
+    else:
+        uncorr_vals = np.zeros(n_chans)
+    z_corr = _robust_zscore(uncorr_vals)
     bad_corr.update(np.where(z_corr > z_thresh_corr)[0])
 
-    psd, freqs = psd_array_welch(data, sfreq=sfreq, average="mean")
-    lf_mask = (freqs >= lf_band[0]) & (freqs <= lf_band[1])
-    hf_mask = (freqs >= hf_band[0]) & (freqs <= hf_band[1])
-    lf_power = np.trapz(psd[:, lf_mask], freqs[lf_mask], axis=1)
-    hf_power = np.trapz(psd[:, hf_mask], freqs[hf_mask], axis=1)
+    # Same settings as MNE's psd_array_welch defaults (256-sample Hamming
+    # segments, no overlap), minus its wrapper overhead. Welch runs scipy.fft
+    # underneath; let pocketfft spread the per-segment FFTs over all cores.
+    with scipy.fft.set_workers(FFT_WORKERS):
+        freqs, psd = welch(
+            data, fs=sfreq, window="hamming", nperseg=256, noverlap=0, axis=-1
+        )
+    # Welch bins are sorted and evenly spaced: each inclusive band is a
+    # contiguous slice, integrated with the edge-corrected trapezoid rule.
+    lf_lo, hf_lo = np.searchsorted(freqs, (lf_band[0], hf_band[0]), side="left")
+    lf_hi, hf_hi = np.searchsorted(freqs, (lf_band[1], hf_band[1]), side="right")
+    df = freqs[1] - freqs[0]
+    lf_power = _uniform_trapezoid(psd[:, lf_lo:lf_hi], df)
+    hf_power = _uniform_trapezoid(psd[:, hf_lo:hf_hi], df)
     hf_ratio = np.log10((hf_power + np.finfo(float).eps) / (lf_power + np.finfo(float).eps))
     z_hf = _robust_zscore(hf_ratio)
     bad_hf = set(np.where(z_hf > z_thresh_hf)[0])
 
     bad_ransac: set[int] = set()
-    pred_errors = []
-    for idx in range(n_chans):
-        others = np.delete(data_ds, idx, axis=0)
-        if others.size == 0:
-            pred_errors.append(0.0)
-            continue
-        X = others.T
-        y = data_ds[idx]
+    if n_chans > 1:
         try:
-            coefs, *_ = np.linalg.lstsq(X, y, rcond=None)
-            y_hat = X @ coefs
-            r_pred = np.corrcoef(y, y_hat)[0, 1]
-            pred_error = 1.0 if np.isnan(r_pred) else 1.0 - np.abs(r_pred)
+            predicted, in_span = _leave_one_out_prediction(data_ds)
         except np.linalg.LinAlgError:
-            pred_error = 1.0
-        pred_errors.append(pred_error)
-    z_ransac = _robust_zscore(np.asarray(pred_errors))
+            pred_errors = np.ones(n_chans)
+        else:
+            pred_errors = _rowwise_abs_uncorrelation(data_ds, predicted)
+            if in_span.all() and logger:
+                # With an average reference every channel is minus the sum of
+                # the others, so all prediction errors are 0 and this
+                # criterion cannot flag anything.
+                logger.info(
+                    "RANSAC-style check inactive: every EEG channel is an exact "
+                    "combination of the others (e.g. after average referencing)"
+                )
+    else:
+        pred_errors = np.zeros(n_chans)
+    z_ransac = _robust_zscore(pred_errors)
     bad_ransac.update(np.where(z_ransac > z_thresh_ransac)[0])
 
     bad_indices = bad_amp | bad_corr | bad_hf | bad_ransac
@@ -388,26 +546,124 @@ def detect_bad_channels_prep(
     return bads
 
 
+@functools.lru_cache(maxsize=8)
+def _band_dft_basis(
+    n_per_seg: int, sfreq: float, band: Tuple[float, float], dtype: str, n_fft: int
+) -> Tuple[np.ndarray, float]:
+    """Build the windowed, mean-removed DFT basis for the bins inside ``band``.
+
+    Columns hold the cosine and (negated) sine terms of each band bin of an
+    ``n_fft``-point DFT (segments shorter than ``n_fft`` are implicitly
+    zero-padded), multiplied by the periodic Hamming window of length
+    ``n_per_seg``. Subtracting each column's mean
+    folds Welch's per-segment detrend into the projection, so a single matrix
+    product yields the real/imaginary parts of the band bins directly. The
+    returned scale converts squared magnitudes to one-sided PSD density.
+
+    Results are cached (and the basis made read-only) because every EDF of a
+    recording session shares the same sampling rate and segment length.
+    """
+
+    # Bin k sits at k * sfreq / n_fft, so the inclusive band edges map to bin
+    # indices directly without building and searching the rfft grid.
+    k0 = int(math.ceil(band[0] * n_fft / sfreq))
+    k1 = min(int(math.floor(band[1] * n_fft / sfreq)) + 1, n_fft // 2 + 1)
+    if k1 <= k0:
+        raise RuntimeError(f"No PSD bins inside {band[0]}-{band[1]} Hz at sfreq={sfreq}")
+
+    window = np.hamming(n_per_seg + 1)[:-1]
+    turns = np.outer(np.arange(n_per_seg), np.arange(k0, k1)) % n_fft
+    phase = (2.0 * np.pi / n_fft) * turns
+    basis = np.concatenate([np.cos(phase), -np.sin(phase)], axis=1) * window[:, None]
+    basis -= basis.mean(axis=0)
+    basis = basis.astype(dtype)
+    basis.setflags(write=False)
+    scale = 2.0 / (sfreq * np.sum(window**2))
+    return basis, scale
+
+
+def _alpha_band_power(
+    data: np.ndarray,
+    sfreq: float,
+    n_per_seg: int = FAA_N_PER_SEG,
+    dtype: np.dtype | type = np.float32,
+    block_segs: int = 64,
+) -> np.ndarray:
+    """Return the mean Welch PSD inside ``ALPHA_BAND`` for each row of ``data``.
+
+    Matches MNE's ``compute_psd(method="welch")`` defaults on one contiguous
+    span (2048-sample Hamming segments, no overlap, per-segment mean removal,
+    one-sided density scaling; a span shorter than one segment is analyzed
+    as a single shorter, zero-padded segment) but only evaluates the DFT at
+    the alpha bins, as BLAS matrix products against a cached basis instead of
+    a full rfft per segment.
+
+    Segments are streamed in blocks of ``block_segs`` and cast to ``dtype``
+    (single precision by default) one cache-sized block at a time, so no
+    converted copy of the recording is ever materialized. Per-segment powers
+    are accumulated in float64.
+    """
+
+    n_chans, n_times = data.shape
+    n_fft = n_per_seg
+    n_per_seg = min(n_per_seg, n_times)
+    n_segs = n_times // n_per_seg
+    band = (float(ALPHA_BAND[0]), float(ALPHA_BAND[1]))
+    basis, scale = _band_dft_basis(
+        n_per_seg, float(sfreq), band, np.dtype(dtype).str, n_fft
+    )
+    n_bins = basis.shape[1] // 2
+
+    power = np.empty((n_chans, n_segs))
+    for ch in range(n_chans):
+        # Non-overlapping segments of one row are a reshape, i.e. a view.
+        segments = data[ch, : n_segs * n_per_seg].reshape(n_segs, n_per_seg)
+        for start in range(0, n_segs, block_segs):
+            block = segments[start : start + block_segs].astype(basis.dtype, copy=False)
+            power[ch, start : start + block_segs] = np.square(block @ basis).sum(
+                axis=-1, dtype=np.float64
+            )
+    return power.mean(axis=-1) * (scale / n_bins)
+
+
 def compute_faa_log10(raw: mne.io.BaseRaw) -> dict[str, float]:
     """Return log10 PSD for F3/F4 (alpha band) and FAA as F4 - F3."""
 
     picks = {ch: idx for idx, ch in enumerate(raw.ch_names)}
-    missing = [ch for ch in ("F3", "F4") if ch not in picks]
+    missing = [ch for ch in FAA_CHANNELS if ch not in picks]
     if missing:
         raise RuntimeError(f"Missing required frontal channels: {', '.join(missing)}")
 
-    psd = raw.compute_psd(
-        method="welch",
-        fmin=ALPHA_BAND[0],
-        fmax=ALPHA_BAND[1],
-        picks=["F3", "F4"],
-    )
-    power = psd.get_data()
-    mean_power = power.mean(axis=1)
-    log10_power = np.log10(mean_power)
-
-    log10_f3 = float(log10_power[0])
-    log10_f4 = float(log10_power[1])
+    # A (2, n_times) read of F3/F4 only; no copy of the full raw is needed.
+    # Integer picks from the name index skip MNE's name-based pick resolution.
+    faa_idx = np.array([picks[ch] for ch in FAA_CHANNELS], dtype=np.intp)
+    tmax = None
+    if FAA_WINDOW_S is not None and FAA_WINDOW_S <= 0:
+        raise ValueError(
+            f"FAA_WINDOW_S must be a positive number of seconds or None, got {FAA_WINDOW_S}"
+        )
+    if FAA_WINDOW_S is not None and FAA_WINDOW_S < raw.times[-1]:
+        tmax = FAA_WINDOW_S
+    # BAD_ annotated samples come back as NaN. Like MNE's compute_psd, each
+    # good span gets its own Welch estimate (segments never straddle a
+    # rejected gap), weighted by the number of samples it contributes.
+    data = raw.get_data(picks=faa_idx, reject_by_annotation="NaN", tmax=tmax)
+    good = np.concatenate(([False], ~np.isnan(data[0]), [False]))
+    edges = np.flatnonzero(np.diff(good))
+    if len(edges) == 0:
+        raise RuntimeError("No data left for FAA after BAD_ annotations")
+    span_powers = []
+    weights = []
+    for onset, offset in zip(edges[::2], edges[1::2]):
+        span_len = offset - onset
+        span_powers.append(_alpha_band_power(data[:, onset:offset], raw.info["sfreq"]))
+        # Samples past the last whole segment of a span are not analyzed.
+        if span_len >= FAA_N_PER_SEG:
+            span_len -= span_len % FAA_N_PER_SEG
+        weights.append(span_len)
+    mean_power = np.average(span_powers, axis=0, weights=weights)
+    # One vectorized log10 for both channels; tolist() yields Python floats.
+    log10_f3, log10_f4 = np.log10(mean_power).tolist()
     faa = log10_f4 - log10_f3
     return {
         "log10_F3": log10_f3,
@@ -416,17 +672,114 @@ def compute_faa_log10(raw: mne.io.BaseRaw) -> dict[str, float]:
     }
 
 
+@functools.lru_cache(maxsize=8)
+def _bandpass_taps(sfreq: float, l_freq: float, h_freq: float) -> np.ndarray:
+    """Zero-phase FIR taps identical to ``raw.filter(l_freq, h_freq)`` defaults."""
+
+    taps = mne.filter.create_filter(
+        None, sfreq, l_freq, h_freq, method="fir", fir_design="firwin", verbose="ERROR"
+    )
+    taps.flags.writeable = False
+    return taps
+
+
+@functools.lru_cache(maxsize=8)
+def _notch_taps(sfreq: float, freqs: Tuple[float, ...]) -> np.ndarray:
+    """Zero-phase FIR taps identical to ``raw.notch_filter(freqs)`` defaults.
+
+    MNE builds the notch as a band-stop around each frequency with a width of
+    ``freq / 200`` and a 1 Hz transition band split over both edges.
+    """
+
+    centers = np.asarray(freqs, dtype=float)
+    half_width = centers / 400.0 + 0.5
+    taps = mne.filter.create_filter(
+        None,
+        sfreq,
+        centers + half_width,
+        centers - half_width,
+        l_trans_bandwidth=0.5,
+        h_trans_bandwidth=0.5,
+        method="fir",
+        fir_design="firwin",
+        verbose="ERROR",
+    )
+    taps.flags.writeable = False
+    return taps
+
+
+def _zero_phase_fir(data: np.ndarray, taps: np.ndarray) -> np.ndarray:
+    """Apply linear-phase ``taps`` to every row at once, compensating the delay.
+
+    Rows are extended by ``len(taps) - 1`` samples of odd reflection on each
+    side, like MNE's ``reflect_limited`` FIR padding, then convolved in one
+    ``oaconvolve`` call.
+    """
+
+    n_times = data.shape[-1]
+    n_edge = max(min(len(taps), n_times) - 1, 0)
+    padded = np.pad(data, ((0, 0), (n_edge, n_edge)), mode="reflect", reflect_type="odd")
+    with scipy.fft.set_workers(FFT_WORKERS):
+        filtered = oaconvolve(padded, taps[np.newaxis, :], mode="full", axes=-1)
+    start = n_edge + (len(taps) - 1) // 2
+    return filtered[:, start : start + n_times]
+
+
+def apply_fir_filters(raw: mne.io.BaseRaw, block_chans: int = 8) -> None:
+    """Band-pass (``L_FREQ``-``H_FREQ``) then notch (``NOTCH_FREQS``) the EEG in place.
+
+    Same result as ``raw.filter`` followed by ``raw.notch_filter``, but the
+    taps are designed once per sampling rate and each pass filters all EEG
+    rows in a single convolution instead of row by row.
+    """
+
+    sfreq = raw.info["sfreq"]
+    skip = tuple(
+        d for d in raw.annotations.description if d.lower().startswith(("edge", "bad_acq_skip"))
+    )
+    # MNE has no public way to record the band edges without filtering, so the
+    # fast path relies on Info._unlock (what raw.filter itself uses). If a
+    # future MNE drops it, fall back to MNE's own filters rather than saving a
+    # FIF whose highpass/lowpass say the data are unfiltered.
+    can_record_edges = callable(getattr(raw.info, "_unlock", None))
+    if skip or not can_record_edges:
+        # Segment boundaries are filtered piecewise by MNE; keep its path.
+        raw.filter(L_FREQ, H_FREQ, picks="eeg", method="fir", fir_design="firwin")
+        raw.notch_filter(NOTCH_FREQS, picks="eeg")
+        return
+
+    bandpass = _bandpass_taps(sfreq, L_FREQ, H_FREQ)
+    notch = _notch_taps(sfreq, tuple(NOTCH_FREQS))
+    # A few rows per pass keeps the padded/convolved temporaries to a small
+    # fraction of the recording instead of several full-size copies.
+    eeg_picks = mne.pick_types(raw.info, eeg=True, meg=False)
+    for start in range(0, len(eeg_picks), block_chans):
+        raw.apply_function(
+            lambda x: _zero_phase_fir(_zero_phase_fir(x, bandpass), notch),
+            picks=eeg_picks[start : start + block_chans],
+            channel_wise=False,
+        )
+    # raw.filter records the band-pass edges; apply_function does not.
+    with raw.info._unlock():  # private MNE API, guarded above
+        raw.info["highpass"] = max(raw.info["highpass"] or 0.0, float(L_FREQ))
+        raw.info["lowpass"] = min(raw.info["lowpass"] or np.inf, float(H_FREQ))
+
+
 # ---------------------------------------------------------------------------
 # Main workflow
 # ---------------------------------------------------------------------------
 
 def process_edf(
     edf_path: Path,
-    rename_map: dict[str, str],
+    rename_map: dict[str, Tuple[str, str]],
     rename_label: str,
     logger: logging.Logger,
-) -> None:
-    """Run the PREP-style pipeline on a single EDF and compute FAA."""
+) -> dict[str, str | float] | None:
+    """Run the PREP-style pipeline on a single EDF and compute FAA.
+
+    Returns the FAA row written to ``<stem>_faa.csv``, or ``None`` if FAA
+    could not be computed.
+    """
 
     participant_id, condition = parse_filename(edf_path.stem)
     subject_label = participant_id or "unknown"
@@ -434,7 +787,9 @@ def process_edf(
         "Processing %s (participant=%s, condition=%s)", edf_path.name, subject_label, condition
     )
 
-    raw = mne.io.read_raw_edf(edf_path, preload=True, verbose="ERROR")
+    # Renames, channel types and the montage only touch the header, so defer
+    # decoding the samples until referencing needs them.
+    raw = mne.io.read_raw_edf(edf_path, preload=False, verbose="ERROR")
 
     apply_channel_renames(raw, rename_map, rename_label, logger)
     status_mapping = {"Status": "stim"}
@@ -444,14 +799,20 @@ def process_edf(
     if training_misc:
         set_channel_types_ignore_missing(raw, training_misc, logger, "training electrodes")
 
-    montage = mne.channels.make_standard_montage("standard_1020")
-    raw.set_montage(montage, on_missing="warn")
+    raw.set_montage(_STD_1020, on_missing="warn")
+    raw.load_data(verbose="ERROR")
     raw.set_eeg_reference(REF_KIND)
 
     ensure_valid_eeg_positions(raw, logger)
 
-    raw.filter(L_FREQ, H_FREQ, picks="eeg", method="fir", fir_design="firwin")
-    raw.notch_filter(NOTCH_FREQS, picks="eeg")
+    # Filtering, interpolation and saving update ``raw`` in place rather than
+    # on a copied Raw. Filtering works through a few channels at a time, the
+    # bad-channel detector keeps a float32 copy of the EEG rows, and FAA
+    # copies only F3/F4.
+    if APPLY_FIR_FILTER:
+        apply_fir_filters(raw)
+    else:
+        logger.info("Skipping FIR bandpass/notch; alpha band isolated in the PSD")
 
     bads = detect_bad_channels_prep(
         raw,
@@ -472,30 +833,134 @@ def process_edf(
         logger.warning("Skipping bad-channel interpolation: %s", exc)
 
     clean_fname = edf_path.with_name(f"{edf_path.stem}_clean_eeg.fif")
-    raw.save(clean_fname, overwrite=True)
-    logger.info("Saved cleaned FIF: %s", clean_fname)
-
     faa_csv = edf_path.with_name(f"{edf_path.stem}_faa.csv")
+    with ThreadPoolExecutor(max_workers=1) as fif_writer:
+        # ``raw`` is final from here on, so the large FIF write runs in the
+        # background while FAA is computed from the same in-memory data.
+        fif_future = None
+        if SAVE_FIF:
+            # float32 samples (MNE's default, spelled out) in 10 s data
+            # buffers, so the file carries far fewer per-buffer tags.
+            fif_future = fif_writer.submit(
+                raw.save, clean_fname, fmt="single", buffer_size_sec=10.0, overwrite=True
+            )
+
+        faa_rows: dict[str, str | float] | None = None
+        try:
+            faa_metrics = compute_faa_log10(raw)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Failed to compute FAA for %s: %s", edf_path.name, exc)
+        else:
+            faa_rows = {
+                "participant_id": subject_label,
+                "condition": condition,
+                "alpha_band_hz": f"{ALPHA_BAND[0]}-{ALPHA_BAND[1]}",
+                **faa_metrics,
+            }
+            # One header and one row of IDs, fixed labels and floats, none of
+            # which need CSV quoting; CRLF matches csv.DictWriter's output.
+            faa_csv.write_text(
+                ",".join(faa_rows) + "\r\n" + ",".join(map(str, faa_rows.values())) + "\r\n",
+                newline="",
+            )
+            logger.info("Saved FAA CSV: %s", faa_csv)
+
+    if fif_future is not None:
+        fif_future.result()
+        logger.info("Saved cleaned FIF: %s", clean_fname)
+    return faa_rows
+
+
+def write_faa_summary(
+    faa_rows: list[dict[str, str | float]], out_csv: Path, logger: logging.Logger
+) -> None:
+    """Write every EDF's FAA row into one combined CSV table."""
+
+    with out_csv.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(faa_rows[0]))
+        writer.writeheader()
+        writer.writerows(faa_rows)
+    logger.info("Saved combined FAA CSV (%d rows): %s", len(faa_rows), out_csv)
+
+
+def _init_worker(fft_workers: int) -> None:
+    """Set a worker process's FFT thread count before it takes any EDF."""
+
+    global FFT_WORKERS
+    FFT_WORKERS = fft_workers
+
+
+def _process_edf_worker(
+    edf_path: Path,
+    rename_map: dict[str, Tuple[str, str]],
+    rename_label: str,
+    log_queue: "multiprocessing.Queue[logging.LogRecord]",
+) -> dict[str, str | float] | None:
+    """Run ``process_edf`` in a worker process, logging through ``log_queue``."""
+
+    mne.set_log_level("WARNING")
+    logger = logging.getLogger("edf_to_fif_and_faa")
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
     try:
-        faa_metrics = compute_faa_log10(raw)
+        return process_edf(edf_path, rename_map, rename_label, logger)
     except Exception as exc:  # noqa: BLE001
-        logger.error("Failed to compute FAA for %s: %s", edf_path.name, exc)
-        return
+        logger.error("Failed to process %s: %s", edf_path.name, exc)
+        return None
 
-    faa_rows = {
-        "participant_id": subject_label,
-        "condition": condition,
-        "alpha_band_hz": f"{ALPHA_BAND[0]}-{ALPHA_BAND[1]}",
-        **faa_metrics,
-    }
-    with faa_csv.open("w", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(faa_rows))
-        writer.writeheader()
-        writer.writerow(faa_rows)
-    logger.info("Saved FAA CSV: %s", faa_csv)
+
+def _process_edfs_parallel(
+    edf_files: list[Path],
+    rename_map: dict[str, Tuple[str, str]],
+    rename_label: str,
+    logger: logging.Logger,
+    n_workers: int,
+) -> list[dict[str, str | float] | None]:
+    """Process independent EDFs across ``n_workers`` processes, in input order."""
+
+    logger.info("Processing %d EDFs with %d worker processes", len(edf_files), n_workers)
+    # Parallelism comes from running several EDFs at once, so each worker gets
+    # one BLAS/OpenMP and one FFT thread. The thread variables only take
+    # effect in a fresh interpreter, before NumPy loads its BLAS: forked
+    # workers would inherit the parent's already-running thread pools, so
+    # workers are spawned on every OS (as on Windows).
+    for var in _SINGLE_THREAD_ENV_VARS:
+        os.environ.setdefault(var, "1")
+    results: list[dict[str, str | float] | None] = []
+    with multiprocessing.Manager() as manager:
+        log_queue = manager.Queue()
+        listener = logging.handlers.QueueListener(log_queue, *logger.handlers)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(1,),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        _process_edf_worker, edf_path, rename_map, rename_label, log_queue
+                    ): edf_path
+                    for edf_path in edf_files
+                }
+                for future, edf_path in futures.items():
+                    try:
+                        results.append(future.result())
+                    except Exception as exc:  # noqa: BLE001
+                        logger.error("Failed to process %s: %s", edf_path.name, exc)
+                        results.append(None)
+        finally:
+            listener.stop()
+    return results
 
 
 def main() -> None:
+    # Keep MNE's warnings but drop its per-call filter-design chatter.
+    mne.set_log_level("WARNING")
     logger = configure_logging(SCRIPT_DIR)
 
     try:
@@ -510,11 +975,27 @@ def main() -> None:
         logger.error("No EDF files found next to this script in %s", SCRIPT_DIR)
         return
 
-    for edf_path in edf_files:
-        try:
-            process_edf(edf_path, rename_map, rename_tsv.name, logger)
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Failed to process %s: %s", edf_path.name, exc)
+    n_workers = min(N_JOBS or os.cpu_count() or 1, len(edf_files))
+    if n_workers > 1:
+        results = _process_edfs_parallel(
+            edf_files, rename_map, rename_tsv.name, logger, n_workers
+        )
+    else:
+        results = []
+        # Read the next EDF from disk in the background while the current one
+        # is being filtered and analysed.
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            for idx, edf_path in enumerate(edf_files):
+                if idx + 1 < len(edf_files):
+                    prefetcher.submit(_warm_file_cache, edf_files[idx + 1])
+                try:
+                    results.append(process_edf(edf_path, rename_map, rename_tsv.name, logger))
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("Failed to process %s: %s", edf_path.name, exc)
+
+    faa_rows = [row for row in results if row is not None]
+    if faa_rows:
+        write_faa_summary(faa_rows, SCRIPT_DIR / FAA_SUMMARY_CSV, logger)
 
 
 if __name__ == "__main__":